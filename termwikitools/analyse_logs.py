@@ -1,3 +1,4 @@
+from collections import defaultdict
 from pathlib import Path
 
 import click
@@ -6,19 +7,17 @@ from termwikitools.find_stems import make_stems
 
 
 def by_date(log_directory: str):
-    date_counter: dict[str, dict[str, int]] = {}
+    date_counter: dict[str, dict[str, int]] = defaultdict(
+        lambda: {"terms": 0, "dicts": 0}
+    )
 
     for log in Path(log_directory).glob("*.log.*"):
         contents = log.read_text()
         for line in contents.splitlines():
             date = line.split(" ")[0]
             if "names: [" in line and "names: []" not in line:
-                if date_counter.get(date) is None:
-                    date_counter[date] = {"terms": 0, "dicts": 0}
                 date_counter[date]["terms"] += 1
             if "resolve_dict_entry_list:" in line:
-                if date_counter.get(date) is None:
-                    date_counter[date] = {"terms": 0, "dicts": 0}
                 date_counter[date]["dicts"] += 1
 
     for date in sorted(date_counter.keys()):
@@ -26,7 +25,9 @@ def by_date(log_directory: str):
 
 
 def by_searchterm(log_directory: str):
-    term_counter: dict[str, dict[str, int]] = {}
+    term_counter: dict[str, dict[str, int]] = defaultdict(
+        lambda: {"terms": 0, "dicts": 0}
+    )
     previous_line = ""
 
     for log in Path(log_directory).glob("*.log.*"):
@@ -34,13 +35,9 @@ def by_searchterm(log_directory: str):
         for line in contents.splitlines():
             if "names: [" in line and "names: []" not in line:
                 term = previous_line.split(":")[-1].strip()
-                if term_counter.get(term) is None:
-                    term_counter[term] = {"terms": 0, "dicts": 0}
                 term_counter[term]["terms"] += 1
             if "resolve_dict_entry_list:" in line:
                 term = line.split("_list: ")[-1].strip().split(" src:")[0]
-                if term_counter.get(term) is None:
-                    term_counter[term] = {"terms": 0, "dicts": 0}
                 term_counter[term]["dicts"] += 1
 
             previous_line = line
@@ -50,7 +47,9 @@ def by_searchterm(log_directory: str):
 
 
 def by_lang(log_directory: str):
-    lang_counter: dict[str, dict[str, int]] = {}
+    lang_counter: dict[str, dict[str, int]] = defaultdict(
+        lambda: {"terms": 0, "dicts": 0}
+    )
     stems = make_stems()
     previous_line = ""
 
@@ -60,14 +59,10 @@ def by_lang(log_directory: str):
             if "names: [" in line and "names: []" not in line:
                 term = previous_line.split(":")[-1].strip()
                 for lang in stems.get(term, []):
-                    if lang_counter.get(lang) is None:
-                        lang_counter[lang] = {"terms": 0, "dicts": 0}
                     lang_counter[lang]["terms"] += 1
             if "resolve_dict_entry_list:" in line:
                 term = line.split("_list: ")[-1].strip().split(" src:")[0]
                 for lang in stems.get(term, []):
-                    if lang_counter.get(lang) is None:
-                        lang_counter[lang] = {"terms": 0, "dicts": 0}
                     lang_counter[lang]["dicts"] += 1
 
             previous_line = line
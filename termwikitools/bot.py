@@ -23,8 +23,8 @@ import time
 import click
 import requests
 
-from termwikitools.dumphandler import NAMESPACES, DumpHandler
-from termwikitools.handler_common import LANGUAGES
+from termwikitools.dumphandler import DumpHandler
+from termwikitools.handler_common import LANGUAGES, NAMESPACES
 from termwikitools.sitehandler import SiteHandler
 
 
@@ -175,8 +175,9 @@ def terms_of_lang(language):
 def statistics(languages):
     """Print statistics for one or more languages."""
     dumphandler = DumpHandler()
-    for language in languages:
-        dumphandler.statistics(language=LANGUAGES[language])
+    dumphandler.statistics(
+        languages=list(dict.fromkeys(LANGUAGES[language] for language in languages))
+    )
 
 
 @dump.command()
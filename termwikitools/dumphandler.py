@@ -18,10 +18,12 @@
 #
 
 import collections
+import functools
 import json
 import os
 import re
 import sys
+import textwrap
 from dataclasses import asdict
 from pathlib import Path
 from typing import Generator, Iterable, Tuple
@@ -32,7 +34,7 @@ from lxml.etree import _Element
 from marshmallow import ValidationError
 
 from termwikitools import read_termwiki
-from termwikitools.handler_common import LANGUAGES, NAMESPACES
+from termwikitools.handler_common import LANGUAGES, NAMESPACE_SET
 from termwikitools.read_termwiki import (
     INVALID_CHARS_RE,
     Concept,
@@ -42,6 +44,59 @@ from termwikitools.read_termwiki import (
 )
 
 ATTS = re.compile(r"@[^@]+@")
+PUNCTUATION_RE = re.compile(r"[(),?+*[\]=;:!]")
+WORD_SEPARATOR_RE = re.compile(r"[\s/]+")
+STATISTICS_KEYS = ("expressions", "true_expressions", "false_expressions", "invalid")
+# The dump is written back by sort_dump, so its whitespace is kept as it is
+DUMP_PARSER = etree.XMLParser(collect_ids=False, huge_tree=True)
+MEDIAWIKI_NAMESPACES = {"mw": "http://www.mediawiki.org/xml/export-0.10/"}
+MEDIAWIKI_NS = "{http://www.mediawiki.org/xml/export-0.10/}"
+PAGE_TAG = f"{MEDIAWIKI_NS}page"
+TITLE_TAG = f"{MEDIAWIKI_NS}title"
+ID_TAG = f"{MEDIAWIKI_NS}id"
+REVISION_TEXT_PATH = f"{MEDIAWIKI_NS}revision/{MEDIAWIKI_NS}text"
+TIMESTAMP_PATH = f".//{MEDIAWIKI_NS}timestamp"
+PAGES_XPATH = etree.XPath(".//mw:page", namespaces=MEDIAWIKI_NAMESPACES)
+PAGE_TITLE_XPATH = etree.XPath(
+    ".//mw:page/mw:title[text() = $title]", namespaces=MEDIAWIKI_NAMESPACES
+)
+TITLE_TEXT_XPATH = etree.XPath("string(mw:title)", namespaces=MEDIAWIKI_NAMESPACES)
+REDIRECT_PAGES_XPATH = etree.XPath(
+    './/mw:page[mw:revision/mw:text[starts-with(text(), "#STIVREN")]]',
+    namespaces=MEDIAWIKI_NAMESPACES,
+)
+TITLES_STARTING_WITH_XPATH = etree.XPath(
+    ".//mw:title[starts-with(text(), $prefix)]", namespaces=MEDIAWIKI_NAMESPACES
+)
+
+
+@functools.cache
+def load_analyser(language: str, fst_type: str) -> hfst.HfstTransducer:
+    """Load an hfst analyser once and reuse it for the rest of the run.
+
+    Args:
+        language (str): the language of the analyser.
+        fst_type (str): norm or desc.
+
+    Returns:
+        The loaded analyser.
+    """
+    return hfst.HfstInputStream(
+        f"/usr/local/share/giella/{language}/analyser-gt-{fst_type}.hfstol"
+    ).read()
+
+
+@functools.cache
+def parse_dump(dump: str) -> etree._ElementTree:
+    """Parse a dump file once and reuse the tree for the rest of the run.
+
+    Args:
+        dump (str): path to the dump file.
+
+    Returns:
+        The parsed dump file.
+    """
+    return etree.parse(dump, parser=DUMP_PARSER)
 
 
 class DumpHandler:
@@ -56,51 +111,85 @@ class DumpHandler:
 
     termwiki_xml_root = os.path.join(os.getenv("GTHOME") or "", "words/terms/termwiki")
     dump = os.path.join(termwiki_xml_root, "dump.xml")
-    tree = etree.parse(dump)
-    mediawiki_ns = "{http://www.mediawiki.org/xml/export-0.10/}"
+    mediawiki_ns = MEDIAWIKI_NS
+
+    @property
+    def tree(self) -> etree._ElementTree:
+        """The parsed dump file.
+
+        It is parsed on first use, so merely importing this module does not
+        read the dump, and it is shared by all DumpHandler instances.
+        """
+        return parse_dump(self.dump)
 
     def save_concept(self, tw_concept: Concept, main_title: str) -> None:
         """Save a concept to the dump file."""
-        root = self.tree.getroot()
-        namespace = {"mw": "http://www.mediawiki.org/xml/export-0.10/"}
-        titles = root.xpath(f'.//mw:title[text()="{main_title}"]', namespaces=namespace)
-        title = titles[0]
-        if title is not None:
-            page = title.getparent()
-            tuxt = page.xpath(".//mw:text", namespaces=namespace)[0]
+        titles = PAGE_TITLE_XPATH(self.tree.getroot(), title=main_title)
+        if titles:
+            page = titles[0].getparent()
+            tuxt = page.find(REVISION_TEXT_PATH)
             tuxt.text = str(tw_concept)
         else:
             raise SystemExit(f"did not find {main_title}")
 
-    @property
-    def pages(self) -> Iterable[Tuple[str, _Element, str]]:
-        """Get the namespaced pages from dump.xml.
+    def stream_pages(self) -> Iterable[_Element]:
+        """Stream the page elements of dump.xml.
+
+        Unlike the pages found in tree, a streamed page is emptied and
+        removed as soon as the caller asks for the next one. Neither the page
+        nor anything found inside it can be kept, copy what is needed before
+        moving on.
 
         Yields:
-            tuple: The title and the content of a TermWiki page.
+            etree.Element: a page element.
         """
-        for page in self.tree.getroot().iter("{}page".format(self.mediawiki_ns)):
+        for _, page in etree.iterparse(
+            self.dump, tag=PAGE_TAG, collect_ids=False, huge_tree=True
+        ):
+            yield page
+            page.clear(keep_tail=True)
+            while page.getprevious() is not None:
+                del page.getparent()[0]
+
+    @staticmethod
+    def namespaced_pages(
+        page_elements: Iterable[_Element],
+    ) -> Iterable[Tuple[str, _Element, str]]:
+        """Keep the page elements that belong to a TermWiki namespace.
+
+        Args:
+            page_elements: page elements from tree or from stream_pages.
+
+        Yields:
+            tuple: The title, the page element and the id of a TermWiki page.
+        """
+        for page in page_elements:
             if page is not None:
-                title_element = page.find(".//{}title".format(self.mediawiki_ns))
+                title_element = page.find(TITLE_TAG)
                 if title_element is not None and title_element.text is not None:
                     title = title_element.text
-                    if title[: title.find(":")] in NAMESPACES:
-                        page_id_element = page.find(".//{}id".format(self.mediawiki_ns))
+                    if title[: title.find(":")] in NAMESPACE_SET:
+                        page_id_element = page.find(ID_TAG)
                         if (
                             page_id_element is not None
                             and page_id_element.text is not None
                         ):
                             yield title, page, page_id_element.text
 
-    @property
-    def content_elements(self) -> Iterable[Tuple[str, _Element, str]]:
-        """Get concept elements found in dump.xml.
+    @staticmethod
+    def concept_contents(
+        pages: Iterable[Tuple[str, _Element, str]],
+    ) -> Iterable[Tuple[str, _Element, str]]:
+        """Keep the pages whose content is a concept.
+
+        Args:
+            pages: namespaced pages, as made by namespaced_pages.
 
         Yields:
-            etree.Element: the content element found in a page element.
+            tuple: The title, the content element and the id of a page.
         """
-        for title, page, page_id in self.pages:
-            content_elt = page.find(f".//{self.mediawiki_ns}text")
+        for title, page, page_id in pages:
+            content_elt = page.find(REVISION_TEXT_PATH)
             if (
                 content_elt is not None
                 and content_elt.text
@@ -108,6 +197,38 @@ class DumpHandler:
             ):
                 yield title, content_elt, page_id
 
+    @property
+    def pages(self) -> Iterable[Tuple[str, _Element, str]]:
+        """Get the namespaced pages from the parsed dump.
+
+        The page elements belong to tree, so they may be kept and changed.
+
+        Yields:
+            tuple: The title, the page element and the id of a TermWiki page.
+        """
+        return self.namespaced_pages(self.tree.getroot().iter(PAGE_TAG))
+
+    @property
+    def streamed_pages(self) -> Iterable[Tuple[str, _Element, str]]:
+        """Get the namespaced pages by streaming dump.xml.
+
+        Only one page at a time is held in memory, and it is emptied once the
+        caller moves on, see stream_pages. Use pages if the elements are kept.
+
+        Yields:
+            tuple: The title, the page element and the id of a TermWiki page.
+        """
+        return self.namespaced_pages(self.stream_pages())
+
+    @property
+    def content_elements(self) -> Iterable[Tuple[str, _Element, str]]:
+        """Get concept elements found in the parsed dump.
+
+        Yields:
+            tuple: The title, the content element and the id of a page.
+        """
+        return self.concept_contents(self.pages)
+
     @property
     def termwiki_pages(self) -> Iterable[Tuple[str, TermWikiPage]]:
         """Get concepts found in dump.xml.
@@ -115,11 +236,32 @@ class DumpHandler:
         Yields:
             Concept: the content element found in a page element.
         """
-        for title, content_elt, _ in self.content_elements:
+        return self.termwiki_pages_containing("")
+
+    def termwiki_pages_containing(
+        self, needle: str
+    ) -> Iterable[Tuple[str, TermWikiPage]]:
+        """Get concepts whose page text contains needle.
+
+        Pages without needle are skipped before they are parsed. The dump
+        is streamed, as only the TermWikiPage objects made from the page
+        texts leave this method.
+
+        Args:
+            needle (str): text that must be found in the page.
+
+        Yields:
+            Concept: the content element found in a page element.
+        """
+        for title, content_elt, _ in self.concept_contents(self.streamed_pages):
             try:
                 if content_elt is not None and content_elt.text:
-                    yield title, termwiki_page_to_dataclass(
-                        title, iter(content_elt.text.replace("\xa0", " ").splitlines())
+                    text = content_elt.text.replace("\xa0", " ")
+                    if needle not in text:
+                        continue
+                    yield (
+                        title,
+                        termwiki_page_to_dataclass(title, iter(text.splitlines())),
                     )
             except (ValidationError, KeyError) as error:
                 print(
@@ -145,39 +287,47 @@ class DumpHandler:
         )
 
     def dump2json(self):
-        json_file = Path("terms.json")
-        json_file.write_text(
-            json.dumps(
-                [asdict(termwikipage) for _, termwikipage in self.termwiki_pages],
-                ensure_ascii=False,
-                indent=2,
-            )
-        )
+        """Write the termwiki pages to terms.json, one page at a time."""
+        with Path("terms.json").open("w", buffering=1 << 20) as json_file:
+            json_file.write("[")
+            separator = "\n"
+            for _, termwikipage in self.termwiki_pages:
+                page_json = json.dumps(
+                    asdict(termwikipage), ensure_ascii=False, indent=2
+                )
+                json_file.write(f"{separator}{textwrap.indent(page_json, '  ')}")
+                separator = ",\n"
+            json_file.write("\n]" if separator != "\n" else "]")
 
     def not_found_in_normfst(
         self, language: str, only_sanctioned: str
     ) -> collections.defaultdict:
         """Return expressions not found in normfst."""
         not_founds = collections.defaultdict(set)
-        norm_analyser = hfst.HfstInputStream(
-            f"/usr/local/share/giella/{language}/analyser-gt-norm.hfstol"
-        ).read()
+        norm_analyser = load_analyser(language, "norm")
+        knowns: set[str] = set()
 
         base_url = "https://satni.uit.no/termwiki"
         for title, expression in self.expressions(LANGUAGES[language], only_sanctioned):
             for real_expression in [
-                re.sub(r"[\(\),?\+\*\[\]=;:!]", "", real_expression)
-                for real_expression1 in expression.expression.split()
-                for real_expression in real_expression1.split("/")
+                PUNCTUATION_RE.sub("", real_expression)
+                for real_expression in WORD_SEPARATOR_RE.split(expression.expression)
             ]:
                 if (
+                    not real_expression
+                    or real_expression.startswith(("‑", "-"))
+                    or real_expression in knowns
+                ):
+                    continue
+
+                if real_expression in not_founds or not norm_analyser.lookup(
                     real_expression
-                    and not real_expression.startswith(("‑", "-"))
-                    and not norm_analyser.lookup(real_expression)
                 ):
                     not_founds[real_expression].add(
                         f'{base_url}/index.php?title={title.replace(" ", "_")}'
                     )
+                else:
+                    knowns.add(real_expression)
 
         return not_founds
 
@@ -186,12 +336,8 @@ class DumpHandler:
         language: str, not_in_norms: collections.defaultdict
     ) -> dict[str, dict[str, set[str] | list[str]]]:
         # TODO: make suggestions: remove Err-tags, run analyses through generator-norm
-        desc_analyser = hfst.HfstInputStream(
-            f"/usr/local/share/giella/{language}/analyser-gt-desc.hfstol"
-        ).read()
-        founds: dict[str, dict[str, set[str] | list[str]]] = collections.defaultdict(
-            dict
-        )
+        desc_analyser = load_analyser(language, "desc")
+        founds: dict[str, dict[str, set[str] | list[str]]] = {}
 
         for real_expression in not_in_norms:
             analyses = {
@@ -209,10 +355,10 @@ class DumpHandler:
                     analysis for analysis in analyses if analysis.endswith("+Nom")
                 }
             if analyses:
-                founds[real_expression]["analyses"] = analyses
-                founds[real_expression]["sources"] = sorted(
-                    not_in_norms[real_expression]
-                )
+                founds[real_expression] = {
+                    "analyses": analyses,
+                    "sources": not_in_norms[real_expression],
+                }
 
         return founds
 
@@ -224,30 +370,20 @@ class DumpHandler:
         """
 
         def revsorted_expressions(not_founds):
-            return [
-                reverted[::-1]
-                for reverted in sorted([not_found[::-1] for not_found in not_founds])
-            ]
+            return sorted(not_founds, key=lambda not_found: not_found[::-1])
 
         not_in_norms = self.not_found_in_normfst(language, only_sanctioned)
 
         descriptives = self.known_to_descfst(language, not_in_norms)
         for descriptive in revsorted_expressions(descriptives):
-            print(descriptive)
-            print(
-                "\n".join(
-                    [
-                        f"{descriptive}\t{analysis}"
-                        for analysis in descriptives[descriptive]["analyses"]
-                    ]
-                )
+            analyses = "\n".join(
+                f"{descriptive}\t{analysis}"
+                for analysis in descriptives[descriptive]["analyses"]
             )
-            print(
-                "\n".join(
-                    [f"\t{source}" for source in descriptives[descriptive]["sources"]]
-                )
+            sources = "\n".join(
+                f"\t{source}" for source in sorted(descriptives[descriptive]["sources"])
             )
-            print()
+            print(f"{descriptive}\n{analyses}\n{sources}\n")
 
         norms = {
             expression: not_in_norms[expression]
@@ -256,8 +392,7 @@ class DumpHandler:
         }
 
         for norm in revsorted_expressions(norms):
-            print(f"{norm}:{norm} TODO ; !", end="  ")
-            print(" ".join(sorted(norms[norm])))
+            print(f"{norm}:{norm} TODO ; !  {' '.join(sorted(norms[norm]))}")
 
     def sum_terms(self, language: str) -> None:
         """Sum up sanctioned and none sanctioned terms.
@@ -308,7 +443,7 @@ class DumpHandler:
         """Check if collections are correctly defined."""
         for title, _, page in self.pages:
             if title.startswith("Collection:"):
-                content_elt = page.find(".//{}text".format(self.mediawiki_ns))
+                content_elt = page.find(REVISION_TEXT_PATH)
                 text = content_elt.text
                 if text:
                     if "{{Collection" not in text:
@@ -321,11 +456,7 @@ class DumpHandler:
         """Write a collection to an excel file."""
 
         def get_languages(name: str) -> list[str]:
-            namespace = {"mw": "http://www.mediawiki.org/xml/export-0.10/"}
-            collection_elements = self.tree.getroot().xpath(
-                f'.//mw:page/mw:title[text() = "{name}"]',
-                namespaces=namespace,
-            )
+            collection_elements = PAGE_TITLE_XPATH(self.tree.getroot(), title=name)
 
             if not collection_elements:
                 raise SystemExit(f"Collection {name} not found")
@@ -335,7 +466,7 @@ class DumpHandler:
 
             page = collection_elements[0].getparent()
 
-            content_elt = page.find(".//{}text".format(self.mediawiki_ns))
+            content_elt = page.find(REVISION_TEXT_PATH)
             text = content_elt.text
             print(text)
             content = read_termwiki.read_semantic_form(
@@ -347,52 +478,56 @@ class DumpHandler:
         def get_collection_content(
             name: str,
         ) -> Generator[list[Tuple[str, str]], None, None]:
-            for _, termwikipage in self.termwiki_pages:
+            # A page can only belong to the collection if its name is in the text
+            for _, termwikipage in self.termwiki_pages_containing(name):
                 if (
                     termwikipage.concept is not None
                     and termwikipage.concept.collection
                     and name in termwikipage.concept.collection
                 ):
+                    terms_by_language = termwikipage.get_terms_by_language()
+                    definitions = termwikipage.get_definitions_by_language()
                     yield [
                         (
-                            "\n".join(termwikipage.get_terms(language)),
-                            termwikipage.get_definition(language),
+                            "\n".join(terms_by_language.get(language, [])),
+                            definitions.get(language, ""),
                         )
                         for language in languages
                     ]
 
         from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
         from openpyxl.styles import Alignment
 
-        wb = Workbook()
-        ws = wb.active
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet()
+        alignment = Alignment(shrink_to_fit=True, wrap_text=True)
 
         languages = get_languages(f"Collection:{name}")
         ws.append(languages)
-        for y_index, row in enumerate(
-            get_collection_content(f"Collection:{name}"), start=2
-        ):
+        for row in get_collection_content(f"Collection:{name}"):
             if any(terms for (terms, _) in row):
-                for x_index, (terms, definition) in enumerate(row, start=1):
-                    ws.cell(
-                        row=y_index, column=x_index, value=f"{terms}{definition}"
-                    ).alignment = Alignment(shrink_to_fit=True, wrap_text=True)
+                cells = []
+                for terms, definition in row:
+                    cell = WriteOnlyCell(ws, value=f"{terms}{definition}")
+                    cell.alignment = alignment
+                    cells.append(cell)
+                ws.append(cells)
+            else:
+                ws.append([])
 
         wb.save(f"{name.replace(' ', '_')}.xlsx")
 
     def sort_dump(self):
         """Sort the dump file by page title."""
         root = self.tree.getroot()
-        namespace = {"mw": "http://www.mediawiki.org/xml/export-0.10/"}
-
-        pages = root.xpath(".//mw:page", namespaces=namespace)
-        pages[:] = sorted(
-            pages, key=lambda page: page.find("./mw:title", namespaces=namespace).text
-        )
 
-        for page in root.xpath(".//mw:page", namespaces=namespace):
+        pages = PAGES_XPATH(root)
+        for page in pages:
             page.getparent().remove(page)
 
+        pages.sort(key=TITLE_TEXT_XPATH)
+
         for page in pages:
             root.append(page)
 
@@ -410,48 +545,49 @@ class DumpHandler:
                                 langs[expression.language].add(expression.expression)
 
                     if langs[lang1] and langs[lang2]:
-                        for expression in langs[lang1]:
-                            print("{}\t{}".format(expression, ", ".join(langs[lang2])))
+                        translations = ", ".join(langs[lang2])
+                        print(
+                            "\n".join(
+                                f"{expression}\t{translations}"
+                                for expression in langs[lang1]
+                            )
+                        )
+
+    def statistics(self, languages: list[str]) -> None:
+        """Print statistics for the given languages.
 
-    def statistics(self, language: str) -> None:
-        counter: dict[str, dict[str, int]] = {}
+        All languages are counted in one pass over the dump.
+        """
+        counters: dict[str, dict[str, dict[str, int]]] = {
+            language: collections.defaultdict(lambda: collections.defaultdict(int))
+            for language in languages
+        }
         for title, concept in self.termwiki_pages:
-            if any(
-                expression.language == language
-                for expression in concept.related_expressions
-            ):
-                category = title[: title.find(":")]
-                if not counter.get(category):
-                    counter[category] = collections.defaultdict(int)
-                counter[category]["concepts"] += 1
-                expression_with_lang = [
-                    expression
-                    for expression in concept.related_expressions
-                    if expression.language == language
-                ]
-                counter[category]["expressions"] += len(expression_with_lang)
-                counter[category]["true_expressions"] += len(
-                    [
-                        expression
-                        for expression in expression_with_lang
-                        if expression.sanctioned == "True"
-                    ]
-                )
-                counter[category]["false_expressions"] += len(
-                    [
-                        expression
-                        for expression in expression_with_lang
-                        if expression.sanctioned == "False"
-                    ]
-                )
-                counter[category]["invalid"] += len(
-                    [
-                        expression
-                        for expression in expression_with_lang
-                        if INVALID_CHARS_RE.search(expression.expression)
-                    ]
-                )
+            page_counts: dict[str, collections.Counter] = collections.defaultdict(
+                collections.Counter
+            )
+            for expression in concept.related_expressions:
+                if expression.language in counters:
+                    counts = page_counts[expression.language]
+                    counts["expressions"] += 1
+                    if expression.sanctioned == "True":
+                        counts["true_expressions"] += 1
+                    elif expression.sanctioned == "False":
+                        counts["false_expressions"] += 1
+                    if INVALID_CHARS_RE.search(expression.expression):
+                        counts["invalid"] += 1
+
+            for language, counts in page_counts.items():
+                category_counter = counters[language][title[: title.find(":")]]
+                category_counter["concepts"] += 1
+                for key in STATISTICS_KEYS:
+                    category_counter[key] += counts[key]
+
+        for language in languages:
+            self.print_statistics(language, counters[language])
 
+    @staticmethod
+    def print_statistics(language: str, counter: dict[str, dict[str, int]]) -> None:
         total: dict[str, int] = collections.defaultdict(int)
         print(language)
         for category in counter:
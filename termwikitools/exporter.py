@@ -58,8 +58,7 @@ def write_to_termwiki():
 
     # Initialize Site object
     print("Logging in …")
-    sitehandler = bot.SiteHandler()
-    site = sitehandler.get_site()
+    site = bot.SiteHandler().site
 
     for wikifile in args.wikifiles:
         export_json = json.load(open(wikifile))
@@ -74,14 +73,13 @@ def write_to_termwiki():
             termwikipage = TERMWIKI_PAGE_SCHEMA.load(concept)
             site_page = site.Pages[termwikipage.title]
             site_text = site_page.text()
+            termwiki_text = termwikipage.to_termwiki()
             if not site_text:
                 print(f"Saving {termwikipage.title}")
-                site_page.save(termwikipage.to_termwiki(), summary="New import")
-            elif args.force and site_text != termwikipage.to_termwiki():
+                site_page.save(termwiki_text, summary="New import")
+            elif args.force and site_text != termwiki_text:
                 print(f"Overwriting {termwikipage.title}")
-                site_page.save(
-                    termwikipage.to_termwiki(), summary="Overwrite with new content"
-                )
+                site_page.save(termwiki_text, summary="Overwrite with new content")
             else:
                 print(f"{termwikipage.title} already exists")
             time.sleep(0.5)
@@ -10,10 +10,12 @@ import os
 import re
 import sys
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 from lxml import etree
 
 from termwikitools.dumphandler import DumpHandler
+from termwikitools.read_termwiki import SAMMALLAHTI_TRANS
 
 DICTS = [
     "fin-nob",
@@ -31,6 +33,8 @@ DICTS = [
     "smn-sme",
 ]
 
+SMS_DICTS = ["fin-sms", "nob-sms", "rus-sms", "sms-mul"]
+
 LANGS = {
     "en": "eng",
     "fi": "fin",
@@ -47,61 +51,36 @@ LANGS = {
 
 STEMS = defaultdict(set)
 
-REMOVER_RE = r'[ꞌ|@ˣ."*]'
+GIELLALT_HOME = os.path.join(os.getenv("GUTHOME") or "", "giellalt")
+
+REMOVER_RE = re.compile(r'[ꞌ|@ˣ."*]')
 """Remove these characters from Sammallahti's original lemmas."""
 
+ITERPARSE_OPTIONS = {
+    "remove_comments": True,
+    "remove_blank_text": True,
+    "collect_ids": False,
+    "huge_tree": True,
+}
+"""Only the lemmas are read, so skip comments, blank text and the id table."""
+
 
 def sammallahti_remover(line):
     """Remove Sammallahti's special characters."""
-    return re.sub(REMOVER_RE, "", line).strip()
+    return REMOVER_RE.sub("", line).strip()
 
 
 def sammallahti_replacer(line):
     """Replace special characters found in Sammallahti's dictionary."""
-    return sammallahti_remover(line).translate(
-        str.maketrans("Èéíïēīĵĺōūḥḷṃṇṿạẹọụÿⓑⓓⓖ·ṛü’ ", "Eeiieijlouhlmrvaeouybdg ru' ")
-    )
-
-
-def make_dict_entries(dictxml, dictprefix, src, target):
-    for entry in dictxml.iter("l"):
-        if entry.text is not None:
-            STEMS[
-                (
-                    sammallahti_replacer(entry.text)
-                    if dictprefix == "sammallahti"
-                    else entry.text
-                )
-            ].add(src)
-    if dictprefix == "sammallahti":
-        for entry in dictxml.iter("t"):
-            if entry.text is not None and "(+" not in entry.text:
-                STEMS[sammallahti_replacer(entry.text)].add(target)
-
-
-def make_entries(dictxml, dictprefix):
-    pair = dictxml.getroot().get("id")
-    src = pair[:3]
-    target = pair[3:]
-
-    make_dict_entries(dictxml, dictprefix, src, target)
-
-
-def parse_xmlfile(xml_file):
-    parser = etree.XMLParser(remove_comments=True)
-    return etree.parse(xml_file, parser=parser)
+    return sammallahti_remover(line).translate(SAMMALLAHTI_TRANS)
 
 
 def import_sammallahti():
     xml_file = os.path.join(
-        os.getenv("GUTHOME"),
-        "giellalt",
-        "dict-sme-fin-x-sammallahti",
-        "src",
-        "sammallahti.xml",
+        GIELLALT_HOME, "dict-sme-fin-x-sammallahti", "src", "sammallahti.xml"
     )
     try:
-        make_entries(parse_xmlfile(xml_file), dictprefix="sammallahti")
+        make_entries(xml_file, dictprefix="sammallahti")
     except etree.XMLSyntaxError as error:
         print(
             "Syntax error in {} "
@@ -112,43 +91,138 @@ def import_sammallahti():
         print("Continuing without Sammallahti's dictionary")
 
 
-def import_dictfile(xml_file):
-    dictxml = parse_xmlfile(xml_file)
-    make_entries(dictxml, dictprefix="gt")
+def iter_entry_elements(xml_file, tags):
+    """Stream the wanted elements of a dictionary file.
 
+    Entries are removed from the tree as soon as they have been read, so
+    the whole dictionary is never held in memory.
 
-def dict_paths():
-    return [
-        xml_file
-        for pair in DICTS
-        for xml_file in glob.glob(
-            os.path.join(os.getenv("GUTHOME"), "giellalt", f"dict-{pair}", "src")
-            + "/*.xml"
-        )
-        if not xml_file.endswith("meta.xml") and "Der_" not in xml_file
-    ]
+    Args:
+        xml_file (str): path to the dictionary file.
+        tags (tuple): tags of the wanted elements.
+
+    Yields:
+        etree.Element: a wanted element that has text.
+    """
+    for _, element in etree.iterparse(xml_file, tag=("e", *tags), **ITERPARSE_OPTIONS):
+        if element.tag != "e":
+            if element.text is not None:
+                yield element
+        else:
+            element.clear(keep_tail=True)
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
+
+def read_entries(xml_file, dictprefix):
+    """Read the lemmas of a dictionary, and Sammallahti's translations.
+
+    Lemmas and translations are read in the same pass over the file.
+
+    Args:
+        xml_file (str): path to the dictionary file.
+        dictprefix (str): the name of the dictionary.
+
+    Returns:
+        list: (stem, language) tuples.
+    """
+    is_sammallahti = dictprefix == "sammallahti"
+    entries = []
+    src = target = None
+    for element in iter_entry_elements(
+        xml_file, ("l", "t") if is_sammallahti else ("l",)
+    ):
+        if src is None:
+            pair = element.getroottree().getroot().get("id")
+            src = pair[:3]
+            target = pair[3:]
+        if element.tag == "l":
+            entries.append(
+                (sammallahti_replacer(element.text), src)
+                if is_sammallahti
+                else (element.text, src)
+            )
+        elif "(+" not in element.text:
+            entries.append((sammallahti_replacer(element.text), target))
+
+    return entries
+
+
+def make_entries(xml_file, dictprefix):
+    """Index the lemmas of a dictionary, and Sammallahti's translations.
+
+    Args:
+        xml_file (str): path to the dictionary file.
+        dictprefix (str): the name of the dictionary.
+    """
+    for stem, language in read_entries(xml_file, dictprefix):
+        STEMS[stem].add(language)
+
+
+def import_dictfiles(xml_files):
+    """Index the lemmas of gt dictionary files.
+
+    lxml releases the GIL while it parses, so the files are read in a
+    thread pool. Only the main thread touches STEMS.
+
+    Args:
+        xml_files (list): paths to the dictionary files.
+    """
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(xml_files)))) as executor:
+        futures = [
+            executor.submit(read_entries, xml_file, "gt") for xml_file in xml_files
+        ]
+        for future in futures:
+            for stem, language in future.result():
+                STEMS[stem].add(language)
+
+
+def dict_src_files(dict_name):
+    """Find the dictionary xml files in the src directory of a dictionary."""
+    src_dir = os.path.join(GIELLALT_HOME, dict_name, "src")
+    try:
+        with os.scandir(src_dir) as entries:
+            return [
+                entry.path
+                for entry in entries
+                if entry.name.endswith(".xml")
+                and not entry.name.startswith(".")
+                and not entry.name.endswith("meta.xml")
+                and "Der_" not in entry.name
+                and entry.is_file()
+            ]
+    except FileNotFoundError:
+        return []
 
 
 def import_dicts():
-    for xml_file in dict_paths():
-        import_dictfile(xml_file)
+    import_dictfiles(
+        [xml_file for pair in DICTS for xml_file in dict_src_files(f"dict-{pair}")]
+    )
 
 
 def import_smjmed():
-    habmer_home = os.path.join(
-        os.getenv("GUTHOME"), "giellalt", "dict-smj-nob-x-habmer"
-    )
-    for xml_file in glob.glob(f"{habmer_home}/*.xml"):
-        try:
-            make_entries(parse_xmlfile(xml_file), dictprefix="habmer")
-        except etree.XMLSyntaxError as error:
-            print(
-                "Syntax error in {} "
-                "with the following error:\n{}\n".format(xml_file, error),
-                file=sys.stderr,
-            )
-        except OSError:
-            print(f"Continuing without {xml_file}")
+    habmer_home = os.path.join(GIELLALT_HOME, "dict-smj-nob-x-habmer")
+    xml_files = glob.glob(f"{habmer_home}/*.xml")
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(xml_files)))) as executor:
+        futures = [
+            (xml_file, executor.submit(read_entries, xml_file, "habmer"))
+            for xml_file in xml_files
+        ]
+        for xml_file, future in futures:
+            try:
+                entries = future.result()
+            except etree.XMLSyntaxError as error:
+                print(
+                    "Syntax error in {} "
+                    "with the following error:\n{}\n".format(xml_file, error),
+                    file=sys.stderr,
+                )
+            except OSError:
+                print(f"Continuing without {xml_file}")
+            else:
+                for stem, language in entries:
+                    STEMS[stem].add(language)
 
 
 def make_m():
@@ -161,25 +235,14 @@ def make_m():
 
 
 def import_sms():
-    dictprefix = "gt"
-    for lang in ["fin", "nob", "rus"]:
-        for xml_file in glob.glob(
-            os.path.join(os.getenv("GUTHOME"), "giellalt", f"dict-{lang}-sms", "src")
-            + "/*.xml"
-        ):
-            if not xml_file.endswith("meta.xml") and "Der_" not in xml_file:
-                make_dict_entries(parse_xmlfile(xml_file), dictprefix, lang, "sms")
-
-    for xml_file in glob.glob(
-        os.path.join(os.getenv("GUTHOME"), "giellalt", "dict-sms-mul", "src") + "/*.xml"
-    ):
-        if not xml_file.endswith("meta.xml") and "Der_" not in xml_file:
-            dictxml = parse_xmlfile(xml_file)
-            for lang in ["fin", "nob", "rus"]:
-                make_dict_entries(dictxml, dictprefix, "sms", lang)
+    import_dictfiles(
+        [xml_file for pair in SMS_DICTS for xml_file in dict_src_files(f"dict-{pair}")]
+    )
 
 
-def make_stems() -> dict[str, set[str]]:
+def make_stems() -> dict[str, frozenset[str]]:
+    if not os.getenv("GUTHOME"):
+        raise SystemExit("Error: The environment value GUTHOME is not set")
     print("Loading stems")
     import_sammallahti()
     import_dicts()
@@ -187,4 +250,13 @@ def make_stems() -> dict[str, set[str]]:
     import_smjmed()
     import_sms()
 
-    return STEMS
+    # Most stems have one of a handful of language combinations, so they
+    # share one frozenset per combination
+    shared_languages: dict[frozenset[str], frozenset[str]] = {}
+    stems = {}
+    for stem, languages in STEMS.items():
+        frozen_languages = frozenset(languages)
+        stems[stem] = shared_languages.setdefault(frozen_languages, frozen_languages)
+    STEMS.clear()
+
+    return stems
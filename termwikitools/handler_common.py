@@ -43,6 +43,7 @@ NAMESPACES = [
     "Ásttoáigi ja faláštallan",
     "Ávnnasindustriija",
 ]
+NAMESPACE_SET = frozenset(NAMESPACES)
 LANGUAGES = {
     "eng": "en",
     "fin": "fi",
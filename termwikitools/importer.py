@@ -19,8 +19,11 @@
 """Convert term files to termwiki parsable xml."""
 
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import asdict
 from pathlib import Path
+from typing import Any, Iterator
 
 import click
 import openpyxl
@@ -38,7 +41,14 @@ class SheetImporter:
     def __init__(self, sheet):
         self.sheet = sheet
 
-    def row_to_concept(self, sheet_info: dict, row_number: int) -> TermWikiPage:
+    def row_to_concept(
+        self,
+        sheet_info: dict[str, Any],
+        row_number: int,
+        row: tuple,
+        related_expression_templates: list,
+        concept_info_templates: list,
+    ) -> TermWikiPage:
         return TERMWIKI_PAGE_SCHEMA.load(
             {
                 "title": f"{sheet_info['main_category']}:"
@@ -47,88 +57,166 @@ class SheetImporter:
                 "related_expressions": [
                     related_expression
                     for related_expression in self.make_dict(
-                        sheet_info.get("related_expressions") or [], row_number
+                        related_expression_templates, row
                     )
                     if related_expression.get("expression")
                 ],
                 "concept_infos": (
-                    self.make_dict(sheet_info.get("concept_infos") or [], row_number)
-                    if sheet_info.get("concept_infos")
+                    self.make_dict(concept_info_templates, row)
+                    if concept_info_templates
                     else None
                 ),
             }
         )
 
-    def make_dict(self, dict_templates: list, row_number: int) -> list:
+    @staticmethod
+    def compile_templates(dict_templates: list) -> list:
+        """Sort the template values into column numbers and constants.
+
+        This is done once per sheet, so rows need not check the type of
+        every template value.
+
+        Args:
+            dict_templates (list): templates mapping keys to either a column
+                number or a constant value.
+
+        Returns:
+            list: a list of (key, column index, constant) tuples for each
+                template. The column index is None for constants.
+        """
+        return [
+            [
+                (key, value - 1, None) if isinstance(value, int) else (key, None, value)
+                for key, value in dict_template.items()
+            ]
+            for dict_template in dict_templates
+        ]
+
+    @staticmethod
+    def make_dict(compiled_templates: list, row: tuple) -> list:
         return [
             {
                 key: (
-                    self.sheet.cell(row=row_number, column=value).value
-                    if isinstance(value, int)
+                    (row[index] if index < len(row) else None)
+                    if index is not None
                     else value
                 )
-                for key, value in dict_template.items()
+                for key, index, value in compiled_template
             }
-            for dict_template in dict_templates
+            for compiled_template in compiled_templates
         ]
 
+    def rows(self) -> Iterator[tuple[int, tuple]]:
+        """Stream the values of the data rows, skipping the header row.
+
+        Rows where every cell is empty are skipped, the row numbers of the
+        other rows are kept.
+
+        Returns:
+            Iterator: the row number and the cell values of each row.
+        """
+        return (
+            (row_number, row)
+            for row_number, row in enumerate(
+                self.sheet.iter_rows(min_row=2, values_only=True), start=2
+            )
+            if any(value is not None for value in row)
+        )
+
 
 def extract_collection(
-    sheet_importer: SheetImporter, sheetinfo: dict
+    sheet_importer: SheetImporter, sheetinfo: dict[str, Any]
 ) -> list[TermWikiPage]:
+    related_expression_templates = SheetImporter.compile_templates(
+        sheetinfo.get("related_expressions") or []
+    )
+    concept_info_templates = SheetImporter.compile_templates(
+        sheetinfo.get("concept_infos") or []
+    )
     return [
-        sheet_importer.row_to_concept(sheet_info=sheetinfo, row_number=row_number)
-        for row_number in range(2, sheet_importer.sheet.max_row + 1)
+        sheet_importer.row_to_concept(
+            sheet_info=sheetinfo,
+            row_number=row_number,
+            row=row,
+            related_expression_templates=related_expression_templates,
+            concept_info_templates=concept_info_templates,
+        )
+        for row_number, row in sheet_importer.rows()
     ]
 
 
+def import_sheet(
+    filename: str, sheet_infos: dict[str, Any], sheet_info: dict[str, Any]
+) -> None:
+    """Convert one sheet of a workbook to a .result.json file.
+
+    Args:
+        filename (str): path to the workbook.
+        sheet_infos (dict): the content of the template json file.
+        sheet_info (dict): the part of the template describing this sheet.
+    """
+    path = Path(filename)
+    workbook = openpyxl.load_workbook(
+        filename, read_only=True, data_only=True, keep_links=False
+    )
+    template = sheet_info["template"]
+    try:
+        data = {
+            "collection": asdict(
+                COLLECTION_SCHEMA.load(
+                    {
+                        "name": f"Collection:{template.get('collection')}",
+                        "info": sheet_infos.get("info"),
+                        "owner": sheet_infos.get("owner"),
+                        "languages": [
+                            related_expression.get("language")
+                            for related_expression in template.get(
+                                "related_expressions"
+                            )
+                        ],
+                    }
+                )
+            ),
+            "concepts": [
+                asdict(cleanup_termwiki_page(concept))
+                for concept in extract_collection(
+                    sheet_importer=SheetImporter(workbook[sheet_info["sheetname"]]),
+                    sheetinfo=template,
+                )
+            ],
+        }
+    except ValidationError as error:
+        message = f"Error in input data\n{error}"
+        raise SystemExit(message) from error
+    finally:
+        workbook.close()
+
+    path.with_name(
+        f"{template.get('collection').replace(' ', '_')}.result.json"
+    ).write_text(
+        json.dumps(
+            data,
+            indent=2,
+            ensure_ascii=False,
+        )
+    )
+
+
 @click.command()
 @click.argument("filename")
 def main(filename):
     path = Path(filename)
-    workbook = openpyxl.load_workbook(filename)
     template_json = path.with_name(f"{path.stem}.template.json")
     sheet_infos = json.loads(template_json.read_text())
+    sheets = sheet_infos.get("sheets")
 
-    for sheet_info in sheet_infos.get("sheets"):
-        template = sheet_info.get("template")
-        try:
-            data = {
-                "collection": asdict(
-                    COLLECTION_SCHEMA.load(
-                        {
-                            "name": f"Collection:{template.get('collection')}",
-                            "info": sheet_infos.get("info"),
-                            "owner": sheet_infos.get("owner"),
-                            "languages": [
-                                related_expression.get("language")
-                                for related_expression in template.get(
-                                    "related_expressions"
-                                )
-                            ],
-                        }
-                    )
-                ),
-                "concepts": [
-                    asdict(cleanup_termwiki_page(concept))
-                    for concept in extract_collection(
-                        sheet_importer=SheetImporter(
-                            workbook[sheet_info.get("sheetname")]
-                        ),
-                        sheetinfo=template,
-                    )
-                ],
-            }
-        except ValidationError as error:
-            message = f"Error in input data\n{error}"
-            raise SystemExit(message) from error
-
-        path.with_name(
-            f"{template.get('collection').replace(' ', '_')}.result.json"
-        ).write_text(
-            json.dumps(
-                data,
-                indent=2,
-                ensure_ascii=False,
-            )
-        )
+    # The sheets are independent of each other, convert them in parallel
+    with ProcessPoolExecutor(
+        max_workers=max(1, min(len(sheets), os.cpu_count() or 1))
+    ) as executor:
+        futures = [
+            executor.submit(import_sheet, filename, sheet_infos, sheet_info)
+            for sheet_info in sheets
+        ]
+        for future in futures:
+            future.result()
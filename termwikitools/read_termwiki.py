@@ -19,7 +19,8 @@
 """Read termwiki pages."""
 
 import re
-from dataclasses import asdict, dataclass, field
+import sys
+from dataclasses import asdict, dataclass, field, fields
 from typing import Any, Dict, Generator, Iterable
 
 import marshmallow_dataclass
@@ -28,6 +29,41 @@ from marshmallow import ValidationError
 from termwikitools.handler_common import LANGUAGES
 
 INVALID_CHARS_RE = re.compile(r"[()[\]?:;+*=]")
+SAMI_LANGUAGES = frozenset(["se", "sma", "smj", "smn", "sms"])
+LANGUAGE_CODES = frozenset(LANGUAGES.values())
+POS_VALUES = [
+    "N",
+    "A",
+    "Adv",
+    "V",
+    "Pron",
+    "CS",
+    "CC",
+    "Adp",
+    "Po",
+    "Pr",
+    "Interj",
+    "Pcle",
+    "Num",
+    "ABBR",
+    "MWE",
+]
+POS_SET = frozenset(POS_VALUES)
+RELATIONS = [
+    "broader concept",
+    "narrower concept",
+    "coordinate concept",
+    "comprehensive concept",
+    "partitive concept",
+    "pragmatic relation",
+    "unspecified",
+    "synonym",  # value found in Mika Saijets 2005: Boazonamahusat
+    "cohyponym",  # value found in Mika Saijets 2005: Boazonamahusat
+    "hyperonym",  # value found in Mika Saijets 2005: Boazonamahusat
+]
+RELATION_SET = frozenset(RELATIONS)
+STATUSES = ["recommended", "out of date", "avoid", "rare"]
+STATUS_SET = frozenset(STATUSES)
 
 
 def validate_lang(language: str) -> None:
@@ -42,7 +78,7 @@ def validate_lang(language: str) -> None:
     Returns:
         None
     """
-    if language not in LANGUAGES.values():
+    if language not in LANGUAGE_CODES:
         raise ValidationError(f"{language} is not one of {LANGUAGES.values()}")
 
 
@@ -58,54 +94,21 @@ def validate_pos(pos: str) -> None:
     Returns:
         None
     """
-    pos_list = [
-        "N",
-        "A",
-        "Adv",
-        "V",
-        "Pron",
-        "CS",
-        "CC",
-        "Adp",
-        "Po",
-        "Pr",
-        "Interj",
-        "Pcle",
-        "Num",
-        "ABBR",
-        "MWE",
-    ]
-
-    if pos not in pos_list:
-        raise ValidationError(f"{pos} must be one of {pos_list}")
+    if pos not in POS_SET:
+        raise ValidationError(f"{pos} must be one of {POS_VALUES}")
 
 
 def validate_relation(relation: str) -> None:
-    relations = [
-        "broader concept",
-        "narrower concept",
-        "coordinate concept",
-        "comprehensive concept",
-        "partitive concept",
-        "pragmatic relation",
-        "unspecified",
-        "synonym",  # value found in Mika Saijets 2005: Boazonamahusat
-        "cohyponym",  # value found in Mika Saijets 2005: Boazonamahusat
-        "hyperonym",  # value found in Mika Saijets 2005: Boazonamahusat
-    ]
-
-    if relation not in relations:
-        raise ValidationError(f"{relation} is not one of {relations}")
+    if relation not in RELATION_SET:
+        raise ValidationError(f"{relation} is not one of {RELATIONS}")
 
 
 def validate_status(status: str) -> None:
-    statuses = ["recommended", "out of date", "avoid", "rare"]
+    if status not in STATUS_SET:
+        raise ValidationError(f"status must be one of {STATUSES}")
 
-    if status not in statuses:
-        raise ValidationError(f"status must be one of {statuses}")
 
-
-@dataclass
+@dataclass(slots=True)
 class ConceptInfo:
     language: str = field(metadata={"validate": validate_lang})
     definition: str | None
@@ -118,20 +121,23 @@ class ConceptInfo:
         Returns:
             str: The TermWiki format string.
         """
-        strings = ["{{Concept info"]
-        strings.extend(
+        return "\n".join(
             [
-                f"|{key}={value}"
-                for key, value in asdict(self).items()
-                if value is not None
+                "{{Concept info",
+                *(
+                    f"|{key}={value}"
+                    for key in CONCEPT_INFO_KEYS
+                    if (value := getattr(self, key)) is not None
+                ),
+                "}}",
             ]
         )
-        strings.append("}}")
 
-        return "\n".join(strings)
+
+CONCEPT_INFO_KEYS = tuple(info_field.name for info_field in fields(ConceptInfo))
 
 
-@dataclass
+@dataclass(slots=True)
 class RelatedExpression:
     note: str | None
     pos: str | None
@@ -150,32 +156,35 @@ class RelatedExpression:
         Returns:
             str: The TermWiki formatted string.
         """
-        expression_dict = asdict(self)
-        strings = ["{{Related expression"]
-        strings.extend(
+        return "\n".join(
             [
-                f"|{key}={expression_dict[key]}"
-                for key in [
-                    "language",
-                    "expression",
-                    "pos",
-                    "status",
-                    "sanctioned",
-                    "note",
-                    "source",
-                    "inflection",
-                    "country",
-                    "dialect",
-                ]
-                if expression_dict[key] is not None
+                "{{Related expression",
+                *(
+                    f"|{key}={value}"
+                    for key in RELATED_EXPRESSION_KEYS
+                    if (value := getattr(self, key)) is not None
+                ),
+                "}}",
             ]
         )
-        strings.append("}}")
 
-        return "\n".join(strings)
+
+# The order the fields are written to the termwiki
+RELATED_EXPRESSION_KEYS = (
+    "language",
+    "expression",
+    "pos",
+    "status",
+    "sanctioned",
+    "note",
+    "source",
+    "inflection",
+    "country",
+    "dialect",
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class RelatedConcept:
     concept: str
     relation: str = field(
@@ -188,21 +197,20 @@ class RelatedConcept:
         Returns:
             str: The TermWiki format string.
         """
-        concept_dict = asdict(self)
-        strings = ["{{Related concept"]
-        strings.extend(
+        return "\n".join(
             [
-                f"|{key}={concept_dict[key]}"
-                for key in ["concept", "relation"]
-                if concept_dict[key] is not None
+                "{{Related concept",
+                *(
+                    f"|{key}={value}"
+                    for key in ("concept", "relation")
+                    if (value := getattr(self, key)) is not None
+                ),
+                "}}",
             ]
         )
-        strings.append("}}")
 
-        return "\n".join(strings)
 
-
-@dataclass
+@dataclass(slots=True)
 class Concept:
     collection: list[str] | None
     category: str | None
@@ -216,7 +224,7 @@ class Concept:
         Returns:
             str: The TermWiki formatted string representation of the object.
         """
-        concept_dict = asdict(self)
+        concept_dict = {key: getattr(self, key) for key in CONCEPT_KEYS}
         if all(value is None for value in concept_dict.values()):
             return "{{Concept}}"
 
@@ -224,20 +232,23 @@ class Concept:
         if self.collection:
             concept_dict["collection"] = "@@ ".join(self.collection)
 
-        strings = ["{{Concept"]
-        strings.extend(
+        return "\n".join(
             [
-                f"|{key}={value}"
-                for key, value in concept_dict.items()
-                if value is not None
+                "{{Concept",
+                *(
+                    f"|{key}={value}"
+                    for key, value in concept_dict.items()
+                    if value is not None
+                ),
+                "}}",
             ]
         )
-        strings.append("}}")
 
-        return "\n".join(strings)
+
+CONCEPT_KEYS = tuple(concept_field.name for concept_field in fields(Concept))
 
 
-@dataclass
+@dataclass(slots=True)
 class TermWikiPage:
     title: str
     concept: Concept | None
@@ -251,30 +262,24 @@ class TermWikiPage:
         Returns:
             str: The TermWiki formatted string representation of the object.
         """
-        strings = []
-        if self.concept_infos:
-            strings.extend(
-                [concept_info.to_termwiki() for concept_info in self.concept_infos]
-            )
-
-        strings.extend(
+        return "\n".join(
             [
-                related_expression.to_termwiki()
-                for related_expression in self.related_expressions
+                *(
+                    concept_info.to_termwiki()
+                    for concept_info in self.concept_infos or ()
+                ),
+                *(
+                    related_expression.to_termwiki()
+                    for related_expression in self.related_expressions
+                ),
+                *(
+                    related_concept.to_termwiki()
+                    for related_concept in self.related_concepts or ()
+                ),
+                self.concept.to_termwiki() if self.concept else "{{Concept}}",
             ]
         )
 
-        if self.related_concepts:
-            strings.extend(
-                [
-                    related_concept.to_termwiki()
-                    for related_concept in self.related_concepts
-                ]
-            )
-        strings.append(self.concept.to_termwiki() if self.concept else "{{Concept}}")
-
-        return "\n".join(strings)
-
     def find_invalid(
         self, language: str, sanctioned: bool
     ) -> Generator[str, None, None]:
@@ -296,7 +301,7 @@ class TermWikiPage:
 
     def has_sanctioned_sami(self) -> bool:
         return any(
-            related_expression.language in ["se", "sma", "smj", "smn", "sms"]
+            related_expression.language in SAMI_LANGUAGES
             and related_expression.sanctioned == "True"
             for related_expression in self.related_expressions
         )
@@ -316,12 +321,31 @@ class TermWikiPage:
             if related_expression.language == language
         ]
 
+    def get_terms_by_language(self) -> dict[str, list[str]]:
+        """Group the terms of the page by language in one pass.
+
+        Returns:
+            dict: the terms of each language, formatted as in get_terms.
+        """
+        terms_by_language: dict[str, list[str]] = {}
+        for related_expression in self.related_expressions:
+            terms = terms_by_language.get(related_expression.language)
+            if terms is None:
+                terms = terms_by_language[related_expression.language] = []
+            terms.append(
+                f"{related_expression.expression}"
+                f"{'' if related_expression.sanctioned == 'True' else '*'}"
+            )
+
+        return terms_by_language
+
     def get_languages(self) -> list[str]:
+        # dict keys keep the first-seen order, so the result is stable
         return list(
-            {
+            dict.fromkeys(
                 related_expression.language
                 for related_expression in self.related_expressions
-            }
+            )
         )
 
     def get_definition(self, language: str) -> str:
@@ -332,6 +356,19 @@ class TermWikiPage:
 
         return ""
 
+    def get_definitions_by_language(self) -> dict[str, str]:
+        """Find the definition of every language in one pass.
+
+        Returns:
+            dict: the definition of each language, as found by get_definition.
+        """
+        definitions: dict[str, str] = {}
+        for concept_info in self.concept_infos or []:
+            if concept_info.definition and concept_info.language not in definitions:
+                definitions[concept_info.language] = concept_info.definition
+
+        return definitions
+
 
 TERMWIKI_PAGE_SCHEMA = marshmallow_dataclass.class_schema(TermWikiPage)()
 
@@ -342,7 +379,9 @@ def process_content(text_iterator: Iterable[str]):
     return {
         # turn collection parts into a sorted list of unique elements
         "collection": (
-            {collection.strip() for collection in concept["collection"].split("@@")}
+            sorted(
+                {collection.strip() for collection in concept["collection"].split("@@")}
+            )
             if concept.get("collection") is not None
             else None
         ),
@@ -399,6 +438,11 @@ def termwiki_page_to_dataclass(
     )
 
 
+# Keys with a small, fixed set of values. Their values repeat across all the
+# pages in the dump, so they share one string object each.
+ENUMERATED_KEYS = frozenset(["language", "pos", "sanctioned", "status", "relation"])
+
+
 def read_semantic_form(text_iterator: Iterable[str]) -> Dict[str, str]:
     """Turn a template into a dict.
 
@@ -416,7 +460,9 @@ def read_semantic_form(text_iterator: Iterable[str]) -> Dict[str, str]:
         elif line.startswith("|"):
             (key, _, value) = line[1:].partition("=")
             if value:
-                wiki_form[key] = value.strip()
+                key = sys.intern(key)
+                value = value.strip()
+                wiki_form[key] = sys.intern(value) if key in ENUMERATED_KEYS else value
         else:
             try:
                 wiki_form[key] = "\n".join([wiki_form[key], line.strip()])
@@ -426,18 +472,24 @@ def read_semantic_form(text_iterator: Iterable[str]) -> Dict[str, str]:
     return wiki_form
 
 
+# Sammallahti letters from his sme-fin dictionary
+SAMMALLAHTI_TRANS = str.maketrans(
+    "Èéíïēīĵĺōūḥḷṃṇṿạẹọụÿⓑⓓⓖ·ṛü’ ", "Eeiieijlouhlmrvaeouybdg ru' "
+)
+
+
 LANG_TRANS = {
-    """Sammallahti letters from his sme-fin dictionary"""
-    "se": str.maketrans("Èéíïēīĵĺōūḥḷṃṇṿạẹọụÿⓑⓓⓖ·ṛü’ ", "Eeiieijlouhlmrvaeouybdg ru' "),
-    """Replace invalid accents with valid ones for the sms language.
-
-    * u2019: RIGHT SINGLE QUOTATION MARK
-    * u0027: APOSTROPHE
-    * u2032: PRIME
-    * u00B4: ACUTE ACCENT
-    * u0301: COMBINING ACUTE ACCENT
-    * u02BC: MODIFIER LETTER APOSTROPHE
-    * u02B9: MODIFIER LETTER PRIME"""
+    # Sammallahti letters from his sme-fin dictionary
+    "se": SAMMALLAHTI_TRANS,
+    # Replace invalid accents with valid ones for the sms language.
+    #
+    # * u2019: RIGHT SINGLE QUOTATION MARK
+    # * u0027: APOSTROPHE
+    # * u2032: PRIME
+    # * u00B4: ACUTE ACCENT
+    # * u0301: COMBINING ACUTE ACCENT
+    # * u02BC: MODIFIER LETTER APOSTROPHE
+    # * u02B9: MODIFIER LETTER PRIME
     "sms": str.maketrans(
         "\u2019\u0027\u2032\u00B4\u0301", "\u02BC\u02BC\u02B9\u02B9\u02B9"
     ),
@@ -498,14 +550,29 @@ def cleanup_termwiki_page(termwiki_page: TermWikiPage) -> TermWikiPage:
     Returns:
         TermWikiPage: The cleaned up TermWikiPage object.
     """
-    termwiki_page_dict = asdict(termwiki_page)
-    termwiki_page_dict["concept"] = (
-        cleanup_concept(termwiki_page.concept) if termwiki_page.concept else None
-    )
-    termwiki_page_dict["related_expressions"] = [
-        cleanup_expression(expression)
-        for expression in termwiki_page.related_expressions
-    ]
+    termwiki_page_dict = {
+        "title": termwiki_page.title,
+        "concept": (
+            cleanup_concept(termwiki_page.concept) if termwiki_page.concept else None
+        ),
+        "concept_infos": (
+            [asdict(concept_info) for concept_info in termwiki_page.concept_infos]
+            if termwiki_page.concept_infos is not None
+            else None
+        ),
+        "related_expressions": [
+            cleanup_expression(expression)
+            for expression in termwiki_page.related_expressions
+        ],
+        "related_concepts": (
+            [
+                asdict(related_concept)
+                for related_concept in termwiki_page.related_concepts
+            ]
+            if termwiki_page.related_concepts is not None
+            else None
+        ),
+    }
 
     return TERMWIKI_PAGE_SCHEMA.load(termwiki_page_dict)
 
@@ -520,7 +587,7 @@ def validate_langs(languages: list[str]) -> None:
         ValidationError: If any language in the list is not among the valid languages.
     """
     for language in languages:
-        if language not in LANGUAGES.values():
+        if language not in LANGUAGE_CODES:
             raise ValidationError(
                 f"{language} not among the valid languages: {LANGUAGES.values()}"
             )
@@ -543,7 +610,7 @@ def validate_collection_name(name: str) -> None:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Collection:
     name: str = field(metadata={"validate": validate_collection_name})
     info: list[str] | None
@@ -556,13 +623,15 @@ class Collection:
         Returns:
             str: The TermWiki formatted string.
         """
-        strings = self.info if self.info else []
-        strings.append("\n{{Collection")
-        strings.append(f"|languages={', '.join(self.languages)}")
-        strings.append("}}")
-        strings.append(f"\n[[Kategoriija:{self.owner}]]")
-
-        return "\n".join(strings)
+        return "\n".join(
+            [
+                *(self.info or ()),
+                "\n{{Collection",
+                f"|languages={', '.join(self.languages)}",
+                "}}",
+                f"\n[[Kategoriija:{self.owner}]]",
+            ]
+        )
 
 
 COLLECTION_SCHEMA = marshmallow_dataclass.class_schema(Collection)()
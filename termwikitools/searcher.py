@@ -27,6 +27,9 @@ import click
 from termwikitools import bot, read_termwiki
 from termwikitools.handler_common import LANGUAGES
 
+# Characters stripped from search terms
+SEARCH_TERM_TRANS = str.maketrans("", "", "):")
+
 # For hver av artiklene i inputfila, så vil jeg:
 # 1. Sjekke om termene i artikkelen finnes i søkeindeksen
 # 2. Hvis det finnes ett treff, vis hvilken info fra artikkelen i inputfila
@@ -74,25 +77,22 @@ def search(search_language, searches, outfile):
     search_index = make_search_index()
 
     old_to_new_langs = {v: k for k, v in LANGUAGES.items()}
-    search_terms = sorted(
+    found_terms = sorted(
         {
-            search.lower().strip().replace(")", "").replace(")", "").replace(":", "")
+            search.lower().strip().translate(SEARCH_TERM_TRANS)
             for c_search in searches
             for search in c_search.split()
         }
+        & search_index.keys()
     )
     results = [
         {
-            language: (
-                f'{", ".join(termwiki_page.get_terms(language))}'
-                f" {termwiki_page.get_definition(language)}"
-            ).strip()
+            language: f'{", ".join(terms)} {definitions.get(language, "")}'.strip()
             for termwiki_page in termwiki_pages
-            for language in termwiki_page.get_languages()
+            for definitions in [termwiki_page.get_definitions_by_language()]
+            for language, terms in termwiki_page.get_terms_by_language().items()
         }
-        for termwiki_pages in [
-            search_index[search] for search in search_terms if search in search_index
-        ]
+        for termwiki_pages in [search_index[search] for search in found_terms]
     ]
     langs = sorted(
         {
@@ -127,21 +127,23 @@ def merge_concepts(import_concept, dump_concept):
     )
 
     if import_concept.get("concept_infos"):
-        concept_infos_languages = [
+        concept_infos_languages = {
             concept_info["language"]
             for concept_info in dump_concept.get("concept_infos", [])
-        ]
+        }
 
         for concept_info in import_concept["concept_infos"]:
             if concept_info["language"] not in concept_infos_languages:
+                concept_infos_languages.add(concept_info["language"])
                 dump_concept["concept_infos"].append(concept_info)
 
-    dump_expressions = [
+    dump_expressions = {
         related_expression["expression"]
         for related_expression in dump_concept["related_expressions"]
-    ]
+    }
     for related_expression in import_concept["related_expressions"]:
         if related_expression["expression"] not in dump_expressions:
+            dump_expressions.add(related_expression["expression"])
             dump_concept["related_expressions"].append(related_expression)
 
     return asdict(
@@ -161,26 +163,25 @@ def merge(infile):
         my_json = json.load(f)
         new_concepts = []
         for concept in my_json["concepts"]:
-            search_terms = [
-                (related_expression["expression"], related_expression["language"])
+            # dict keys keep the order of the expressions in the concept
+            expressions = dict.fromkeys(
+                related_expression["expression"]
                 for related_expression in concept["related_expressions"]
-            ]
+            )
 
-            found_pages = [
-                (search, search_index[search[0]])
-                for search in search_terms
-                if search[0] in search_index
-            ]
-
-            if not found_pages:
+            if search_index.keys().isdisjoint(expressions):
                 new_concepts.append(concept)
             else:
-                page_titles = {
-                    page.title for result in found_pages for page in result[1]
+                pages_by_title = {
+                    page.title: page
+                    for expression in expressions
+                    if expression in search_index
+                    for page in search_index[expression]
                 }
+                page_titles = list(pages_by_title)
 
                 if len(page_titles) == 1:
-                    title = list(page_titles)[0]
+                    title = page_titles[0]
                 else:
                     prompt = (
                         "Choose title: \n"
@@ -191,20 +192,16 @@ def merge(infile):
                     )
                     choice = int(input(prompt))
                     try:
-                        title = list(page_titles)[choice]
+                        title = page_titles[choice]
                     except IndexError:
                         title = None
 
                 if title is None:
                     new_concepts.append(concept)
                 else:
-                    for result in found_pages:
-                        for page in result[1]:
-                            if page.title == title:
-                                new_concepts.append(
-                                    merge_concepts(concept, asdict(page))
-                                )
-                                break
+                    new_concepts.append(
+                        merge_concepts(concept, asdict(pages_by_title[title]))
+                    )
 
         my_json["concepts"] = new_concepts
         with click.open_file(infile, "w") as f2:
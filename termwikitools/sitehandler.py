@@ -31,14 +31,30 @@ import marshmallow
 import mwclient  # type: ignore
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore
+
 from termwikitools import read_termwiki
-from termwikitools.dumphandler import DumpHandler
-from termwikitools.handler_common import NAMESPACES
+from termwikitools.dumphandler import (
+    MEDIAWIKI_NAMESPACES,
+    PAGE_TAG,
+    REDIRECT_PAGES_XPATH,
+    REVISION_TEXT_PATH,
+    TIMESTAMP_PATH,
+    TITLE_TAG,
+    TITLES_STARTING_WITH_XPATH,
+    DumpHandler,
+)
+from termwikitools.handler_common import NAMESPACE_SET
+
+TIMESTAMP_FILE = Path(DumpHandler.termwiki_xml_root) / "timestamp"
 
 
 def update_svn() -> None:
-    command = f"svn up {os.getenv('GTHOME')}/words/terms/termwiki"
-    ret_value = subprocess.run(command.split(), capture_output=True, check=False)
+    command = ["svn", "up", DumpHandler.termwiki_xml_root]
+    ret_value = subprocess.run(command, capture_output=True, check=False)
     if ret_value.returncode != 0:
         raise SystemExit(f"Error: {ret_value.stderr.decode()}")
     print(f"Return value: {ret_value.stdout.decode()}")
@@ -46,26 +62,20 @@ def update_svn() -> None:
 
 def read_time_stamp() -> datetime:
     # read time stamp
-    timestamp = (
-        Path(f"{os.getenv('GTHOME')}/words/terms/termwiki/timestamp")
-        .read_text()
-        .strip()
-    )
+    timestamp = TIMESTAMP_FILE.read_text().strip()
     return datetime.fromisoformat(timestamp.rstrip("Z"))
 
 
 def write_time_stamp(timestamp: datetime) -> None:
     # write time stamp
 
-    Path(f"{os.getenv('GTHOME')}/words/terms/termwiki/timestamp").write_text(
-        timestamp.strftime("%Y-%m-%dT%H:%M:%SZ")
-    )
+    TIMESTAMP_FILE.write_text(timestamp.strftime("%Y-%m-%dT%H:%M:%SZ"))
     command = [
         "svn",
         "commit",
         "-m",
         "Update timestamp",
-        f"{os.getenv('GTHOME')}/words/terms/termwiki/timestamp",
+        str(TIMESTAMP_FILE),
     ]
     ret_value = subprocess.run(command, capture_output=True, check=False)
 
@@ -94,7 +104,7 @@ class SiteHandler:
         """
         config_file = os.path.join(os.getenv("HOME"), ".config", "term_config.yaml")
         with open(config_file) as config_stream:
-            config = yaml.load(config_stream, Loader=yaml.FullLoader)
+            config = yaml.load(config_stream, Loader=SafeLoader)
             site = mwclient.Site("satni.uit.no", path="/termwiki/")
             site.login(config["username"], config["password"])
 
@@ -109,7 +119,7 @@ class SiteHandler:
             mwclient.Page
         """
         for category in self.site.allcategories():
-            if category.name.replace("Kategoriija:", "") in NAMESPACES:
+            if category.name.replace("Kategoriija:", "") in NAMESPACE_SET:
                 if verbose:
                     print(category.name)
                 for page in category:
@@ -147,22 +157,15 @@ class SiteHandler:
 
     def delete_redirects(self) -> None:
         dump = DumpHandler()
-        root = dump.tree.getroot()
-        namespace = {"mw": "http://www.mediawiki.org/xml/export-0.10/"}
-        redirects = {
-            redirect_xml.getparent().getparent()
-            for redirect_xml in root.xpath(
-                './/mw:text[starts-with(text(), "#STIVREN")]', namespaces=namespace
-            )
-        }
+        redirects = REDIRECT_PAGES_XPATH(dump.tree.getroot())
         print("Redirects pages", len(redirects))
         for redirect in redirects:
-            title1 = redirect.find(".//mw:title", namespace)
-            page = self.site.pages[title1.text]
+            title = redirect.findtext("mw:title", namespaces=MEDIAWIKI_NAMESPACES)
+            page = self.site.pages[title]
             if page.redirect:
                 page.delete(reason="Redirect page is not needed")
             else:
-                print(f"\tis not redirect {title1.text}")
+                print(f"\tis not redirect {title}")
 
     def add_id(self) -> None:
         dump = DumpHandler()
@@ -201,15 +204,16 @@ class SiteHandler:
         return related_expression_dict
 
     def make_dump_expression_dict(self, dump: DumpHandler) -> dict:
-        namespace = {"mw": "http://www.mediawiki.org/xml/export-0.10/"}
-        return {
-            expression_xml.text.replace("&amp;", "&"): expression_xml.getparent()
-            .xpath(".//mw:text", namespaces=namespace)[0]
-            .text
-            for expression_xml in dump.tree.getroot().xpath(
-                './/mw:title[starts-with(text(), "Expression:")]', namespaces=namespace
-            )
-        }
+        dump_expression_dict = {}
+        for page in dump.tree.getroot().iter(PAGE_TAG):
+            title = page.findtext(TITLE_TAG)
+            if title is not None and title.startswith("Expression:"):
+                text_element = page.find(REVISION_TEXT_PATH)
+                dump_expression_dict[title.replace("&amp;", "&")] = (
+                    text_element.text if text_element is not None else None
+                )
+
+        return dump_expression_dict
 
     def make_expression_pages(
         self,
@@ -229,10 +233,7 @@ class SiteHandler:
         related_expression_dict: collections.defaultdict,
         dump_expression_dict: dict,
     ) -> None:
-        related_expressions = set(related_expression_dict.keys())
-        dump_expressions = set(dump_expression_dict.keys())
-
-        for to_delete in dump_expressions - related_expressions:
+        for to_delete in dump_expression_dict.keys() - related_expression_dict.keys():
             page = self.site.Pages[to_delete]
             if page.exists:
                 print(f"Removing {to_delete}")
@@ -253,30 +254,25 @@ class SiteHandler:
             print("\tmaking", expression_title)
             self.save_page(page, content=content, summary="Making new expression page")
             time.sleep(0.2)
-
-        if page.text() != content:
+        # A page that was just made already has the wanted content, so only
+        # fetch the text of pages that existed before
+        elif page.text() != content:
             print("\treally fixing", expression_title)
             self.save_page(page, content=content, summary="Fixing expression page")
             time.sleep(0.2)
 
     def make_expression_content(self, languages: set) -> str:
-        strings = []
-        for language in sorted(languages):
-            strings.append("{{Expression")
-            strings.append(f"|language={language}")
-            strings.append("}}")
-        content = "\n".join(strings)
-        return content
+        return "\n".join(
+            f"{{{{Expression\n|language={language}\n}}}}"
+            for language in sorted(languages)
+        )
 
     def delete_pages(self, part_of_title: str) -> None:
         dump = DumpHandler()
-        root = dump.tree.getroot()
-        namespace = {"mw": "http://www.mediawiki.org/xml/export-0.10/"}
         to_deletes = {
             expression_xml.text
-            for expression_xml in root.xpath(
-                f'.//mw:title[starts-with(text(), "{part_of_title}")]',
-                namespaces=namespace,
+            for expression_xml in TITLES_STARTING_WITH_XPATH(
+                dump.tree.getroot(), prefix=part_of_title
             )
         }
         print(f"{len(to_deletes)} pages to delete")
@@ -411,9 +407,7 @@ class SiteHandler:
         dumphandler = DumpHandler()
         latest_timestamp = timestamp
         for title, dump_xml_page, page_id in dumphandler.pages:
-            xml_timestamp = dump_xml_page.find(
-                ".//{}timestamp".format(dumphandler.mediawiki_ns)
-            )
+            xml_timestamp = dump_xml_page.find(TIMESTAMP_PATH)
             if xml_timestamp is not None and xml_timestamp.text is not None:
                 dump_timestamp = datetime.fromisoformat(xml_timestamp.text.rstrip("Z"))
                 if dump_timestamp > timestamp:
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""Test the functions found in find_stems."""
+
+import os
+import unittest
+from unittest import mock
+
+from termwikitools import find_stems
+
+
+def add_stems():
+    find_stems.STEMS["guolli"].update(["sme", "fin"])
+    find_stems.STEMS["kala"].update(["fin", "sme"])
+    find_stems.STEMS["fisk"].add("nob")
+
+
+class TestMakeStems(unittest.TestCase):
+    def setUp(self):
+        find_stems.STEMS.clear()
+        patcher = mock.patch.multiple(
+            find_stems,
+            import_sammallahti=mock.DEFAULT,
+            import_dicts=mock.DEFAULT,
+            make_m=mock.DEFAULT,
+            import_smjmed=mock.DEFAULT,
+            import_sms=mock.DEFAULT,
+        )
+        patcher.start()["import_dicts"].side_effect = add_stems
+        self.addCleanup(patcher.stop)
+        environ_patcher = mock.patch.dict(os.environ, {"GUTHOME": "/gut"})
+        environ_patcher.start()
+        self.addCleanup(environ_patcher.stop)
+
+    def test_make_stems(self):
+        self.assertEqual(
+            find_stems.make_stems(),
+            {
+                "guolli": frozenset(["sme", "fin"]),
+                "kala": frozenset(["sme", "fin"]),
+                "fisk": frozenset(["nob"]),
+            },
+        )
+
+    def test_make_stems_shares_language_sets(self):
+        stems = find_stems.make_stems()
+
+        self.assertIs(stems["guolli"], stems["kala"])
+
+    def test_make_stems_empties_stems(self):
+        find_stems.make_stems()
+
+        self.assertEqual(find_stems.STEMS, {})
+
+    def test_make_stems_needs_guthome(self):
+        with mock.patch.dict(os.environ):
+            del os.environ["GUTHOME"]
+            with self.assertRaises(SystemExit):
+                find_stems.make_stems()
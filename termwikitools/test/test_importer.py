@@ -1,89 +1,111 @@
 # -*- coding: utf-8 -*-
 
-import collections
 import os
 import unittest
 
+import openpyxl
+
 from termwikitools import importer
 
+TEMPLATE = {
+    "collection": "simple",
+    "main_category": "Servodatdieđa",
+    "related_expressions": [
+        {"expression": 1, "language": "fi", "pos": 4},
+        {"expression": 2, "language": "nb", "pos": 4},
+        {"expression": 3, "language": "se", "pos": 4},
+    ],
+    "concept_infos": [{"explanation": 5, "language": "nb"}],
+}
+
+
+def make_sheet_with_empty_row():
+    """Make a sheet with an empty row between two filled rows."""
+    sheet = openpyxl.Workbook().active
+    sheet.append(["fi", "nb", "se"])
+    sheet.append(["kala", "fisk", "guolli"])
+    sheet.append([None, None, None])
+    sheet.append(["lintu", "fugl", "loddi"])
+
+    return sheet
 
-class TestExcelImporter(unittest.TestCase):
-    def test_get_concepts(self):
+
+class TestSheetImporter(unittest.TestCase):
+    def test_extract_collection(self):
         self.maxDiff = None
         filename = os.path.join(os.path.dirname(__file__), "excel", "simple.xlsx")
-        ei = importer.ExcelImporter(filename)
+        workbook = openpyxl.load_workbook(filename, read_only=True, data_only=True)
+        sheet_importer = importer.SheetImporter(workbook["Sheet1"])
+
+        got = importer.extract_collection(sheet_importer, TEMPLATE)
+        workbook.close()
+
+        self.assertEqual(len(got), 1)
+        self.assertEqual(got[0].title, "Servodatdieđa:simple_2")
+        self.assertEqual(got[0].concept.collection, ["simple"])
+        self.assertEqual(
+            [
+                (concept_info.language, concept_info.explanation)
+                for concept_info in got[0].concept_infos
+            ],
+            [("nb", "Dette er forklaringen")],
+        )
+        self.assertEqual(
+            [
+                (
+                    related_expression.language,
+                    related_expression.expression,
+                    related_expression.pos,
+                )
+                for related_expression in got[0].related_expressions
+            ],
+            [
+                ("fi", "Suomi", "N"),
+                ("nb", "Norsk", "N"),
+                ("se", "Davvisámegiella", "N"),
+            ],
+        )
+
+    def test_rows_skip_empty_rows(self):
+        """Check that empty rows are skipped, and row numbers are kept."""
+        sheet = make_sheet_with_empty_row()
+
+        got = list(importer.SheetImporter(sheet).rows())
 
-        concept = {
-            "concept": {
+        self.assertEqual(
+            got,
+            [
+                (2, ("kala", "fisk", "guolli")),
+                (4, ("lintu", "fugl", "loddi")),
+            ],
+        )
+
+    def test_extract_collection_skips_empty_rows(self):
+        """Check that an empty row does not become a concept."""
+        sheet = make_sheet_with_empty_row()
+
+        got = importer.extract_collection(
+            importer.SheetImporter(sheet),
+            {
+                "collection": "simple",
                 "main_category": "Servodatdieđa",
-                "collection": set(),
+                "related_expressions": [{"expression": 3, "language": "se"}],
             },
-            "concept_infos": [
-                {
-                    "explanation": "Dette er forklaringen",
-                    "language": "nb",
-                },
+        )
+
+        self.assertEqual(
+            [
+                (
+                    termwiki_page.title,
+                    [
+                        related_expression.expression
+                        for related_expression in termwiki_page.related_expressions
+                    ],
+                )
+                for termwiki_page in got
             ],
-            "related_expressions": [
-                {
-                    "expression": "davvisámegiella",
-                    "language": "se",
-                    "pos": "N",
-                },
-                {
-                    "expression": "suomi",
-                    "language": "fi",
-                    "pos": "N",
-                },
-                {
-                    "expression": "norsk",
-                    "language": "nb",
-                    "pos": "N",
-                },
+            [
+                ("Servodatdieđa:simple_2", ["guolli"]),
+                ("Servodatdieđa:simple_4", ["loddi"]),
             ],
-        }
-        concept["concept"]["collection"].add("simple")
-        ei.get_concepts()
-        got = ei.concepts
-        got_concept = got[0]
-
-        self.assertDictEqual(got_concept["concept"], concept["concept"])
-        for concept_info in got_concept["concept_infos"]:
-            self.assertTrue(concept_info in concept["concept_infos"])
-        for related_expression in got_concept["related_expressions"]:
-            self.assertTrue(related_expression in concept["related_expressions"])
-
-    def test_collect_expressions_test_splitters(self):
-        """Test if legal split chars work as splitters."""
-        counter = collections.defaultdict(int)
-        ei = importer.ExcelImporter("fakename.xlsx")
-        for startline in ["a, b", "a; b", "a\nb", "a/b"]:
-            got = ei.collect_expressions(startline)
-
-            self.assertEqual(["a", "b"], got)
-
-    def test_collect_expressions_illegal_chars(self):
-        """Check that illegal chars in startline is handled correctly."""
-        counter = collections.defaultdict(int)
-        ei = importer.ExcelImporter("fakename.xlsx")
-        for x, startline in enumerate("()-~?"):
-            got = ei.collect_expressions(startline)
-
-            self.assertEqual([startline], got)
-
-    def test_collect_expressions_illegal_chars_with_newline(self):
-        """Check that illegal chars in startline is handled correctly."""
-        counter = collections.defaultdict(int)
-        ei = importer.ExcelImporter("fakename.xlsx")
-        startline = "a-a;\nb=b;\nc?c"
-        got = ei.collect_expressions(startline)
-
-        self.assertEqual([startline.replace("\n", " ")], got)
-
-    def test_collect_expressions_multiword_expression(self):
-        """Handle multiword expression."""
-        counter = collections.defaultdict(int)
-        ei = importer.ExcelImporter("fakename.xlsx")
-        got = ei.collect_expressions("a b")
-
-        self.assertEqual(["a b"], got)
+        )
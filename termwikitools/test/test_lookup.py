@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""Test the lookup module."""
+
+import importlib
+import sys
+import unittest
+from unittest import mock
+
+from termwikitools.dumphandler import DumpHandler
+from termwikitools.read_termwiki import termwiki_page_to_dataclass
+
+PAGES = [
+    (
+        title,
+        termwiki_page_to_dataclass(title, iter(content.splitlines())),
+    )
+    for title, content in [
+        (
+            "Luonddudieđa:guolli",
+            "\n".join(
+                [
+                    "{{Related expression",
+                    "|language=se",
+                    "|expression=guolli",
+                    "|sanctioned=True",
+                    "}}",
+                    "{{Related expression",
+                    "|language=nb",
+                    "|expression=fisk",
+                    "}}",
+                    "{{Concept",
+                    "}}",
+                ]
+            ),
+        ),
+        (
+            "Biras:guolli",
+            "\n".join(
+                [
+                    "{{Related expression",
+                    "|language=se",
+                    "|expression=guolli",
+                    "}}",
+                    "{{Concept",
+                    "}}",
+                ]
+            ),
+        ),
+    ]
+]
+
+
+class TestLookup(unittest.TestCase):
+    def setUp(self):
+        sys.modules.pop("termwikitools.lookup", None)
+        with mock.patch.object(
+            DumpHandler, "termwiki_pages", new_callable=mock.PropertyMock
+        ) as termwiki_pages:
+            termwiki_pages.return_value = PAGES
+            self.lookup = importlib.import_module("termwikitools.lookup")
+        self.addCleanup(sys.modules.pop, "termwikitools.lookup", None)
+
+    def test_lookup_finds_all_pages(self):
+        self.assertEqual(
+            self.lookup.lookup("guolli", "se"),
+            {"Luonddudieđa:guolli", "Biras:guolli"},
+        )
+
+    def test_lookup_uses_language(self):
+        self.assertEqual(self.lookup.lookup("fisk", "nb"), {"Luonddudieđa:guolli"})
+        self.assertEqual(self.lookup.lookup("fisk", "se"), set())
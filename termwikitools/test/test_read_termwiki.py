@@ -326,3 +326,63 @@ class TestConcept(unittest.TestCase):
         concept = read_termwiki.Concept()
         concept.from_termwiki(content)
         self.assertEqual(want, str(concept))
+
+
+class TestCollection(unittest.TestCase):
+    def test_to_termwiki_keeps_info(self):
+        """Check that to_termwiki does not change info between calls."""
+        collection = read_termwiki.Collection(
+            name="Collection:Guolit",
+            info=["Guolit ja eará čáhcealit"],
+            owner="Sámi giellagáldu",
+            languages=["se", "nb"],
+        )
+
+        first = collection.to_termwiki()
+        second = collection.to_termwiki()
+
+        self.assertEqual(collection.info, ["Guolit ja eará čáhcealit"])
+        self.assertEqual(first, second)
+        self.assertEqual(
+            first,
+            "\n".join(
+                [
+                    "Guolit ja eará čáhcealit",
+                    "\n{{Collection",
+                    "|languages=se, nb",
+                    "}}",
+                    "\n[[Kategoriija:Sámi giellagáldu]]",
+                ]
+            ),
+        )
+
+
+class TestCleanupExpression(unittest.TestCase):
+    @staticmethod
+    def make_expression(expression, language):
+        return read_termwiki.RelatedExpression(
+            note=None,
+            pos=None,
+            source=None,
+            inflection=None,
+            country=None,
+            dialect=None,
+            status=None,
+            expression=expression,
+            language=language,
+        )
+
+    def test_lang_trans_keys(self):
+        self.assertEqual(set(read_termwiki.LANG_TRANS), {"se", "sms"})
+
+    def test_cleanup_se_expression(self):
+        got = read_termwiki.cleanup_expression(self.make_expression("ēḷḷo", "se"))
+
+        self.assertEqual(got["expression"], "ello")
+
+    def test_cleanup_sms_expression(self):
+        got = read_termwiki.cleanup_expression(
+            self.make_expression("vuä\u2019dd", "sms")
+        )
+
+        self.assertEqual(got["expression"], "vuä\u02bcdd")